@@ -14,11 +14,34 @@
 """Unit tests for differentiable quantum entropies.
 """
 # pylint: disable=too-many-arguments
+import functools
+import itertools
+import math
+
+import numpy as onp
 import pytest
+from scipy.special import xlogy
 
 import pennylane as qml
 from pennylane import numpy as np
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    import tensorflow as tf
+except ImportError:
+    tf = None
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError:
+    jax = None
+    jnp = None
+
 pytestmark = [
     pytest.mark.filterwarnings(
         r"ignore:The qml\.qinfo\.(vn_entropy|mutual_info|reduced_dm) transform:pennylane.PennyLaneDeprecationWarning"
@@ -28,17 +51,135 @@ pytestmark = [
     ),
 ]
 
+# natural logarithm of each entropy base, so that it is not recomputed for every test case
+LOG_BASES = {2: float(np.log(2)), np.e: 1.0, 10: float(np.log(10))}
+
+
+def assert_close(actual, expected, rtol=1e-05, atol=1e-08):
+    """Assert that ``actual`` and ``expected`` are close once converted to NumPy arrays, using
+    the same default tolerances as ``qml.math.allclose``."""
+    onp.testing.assert_allclose(
+        qml.math.toarray(actual), qml.math.toarray(expected), rtol=rtol, atol=atol
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _framework_param(param, framework):
+    if framework == "torch":
+        return torch.tensor(param, dtype=torch.float64)
+    if framework == "tf":
+        return tf.Variable(param, dtype=tf.float64)
+    return jnp.array(param)
+
+
+def framework_param(param, framework):
+    """Return the scalar ``param`` as a float64 torch, tf or jax tensor, creating it only once
+    per value. The returned tensors are shared between tests and must not be modified, so tests
+    that need a torch or tf gradient leaf create their own."""
+    return _framework_param(float(param), framework)
+
+
+@pytest.fixture(scope="session", name="dev_cache")
+def dev_cache_fixture():
+    """Return a function that creates devices, reusing any device with the same name and
+    wires that was already created during the test session."""
+    # Each pytest-xdist worker is a separate process with its own copy of this cache (and of
+    # the fixtures built on it), so the tests below can be distributed freely between workers.
+    devices = {}
+
+    def get_device(name, wires):
+        if (name, wires) not in devices:
+            devices[(name, wires)] = qml.device(name, wires=wires)
+        return devices[(name, wires)]
+
+    return get_device
+
+
+@pytest.fixture(scope="module", name="ising_qnode")
+def ising_qnode_fixture(dev_cache):
+    """Return a function that creates a QNode returning the state after an IsingXX gate, reusing
+    any QNode with the same device, interface and differentiation method."""
+    qnodes = {}
+
+    def get_qnode(device, interface="auto", diff_method="best"):
+        if (device, interface, diff_method) not in qnodes:
+
+            @qml.qnode(dev_cache(device, 2), interface=interface, diff_method=diff_method)
+            def circuit_state(x):
+                qml.IsingXX(x, wires=[0, 1])
+                return qml.state()
+
+            qnodes[(device, interface, diff_method)] = circuit_state
+        return qnodes[(device, interface, diff_method)]
+
+    return get_qnode
+
+
+@pytest.fixture(scope="module", name="ry_cnot_qnodes")
+def ry_cnot_qnodes_fixture(dev_cache):
+    """Return a function that creates a pair of identical QNodes returning the state after an RY
+    and a CNOT gate, reusing any pair with the same device, interface and diff method."""
+    pairs = {}
+
+    def circuit(param):
+        qml.RY(param, wires=0)
+        qml.CNOT(wires=[0, 1])
+        return qml.state()
+
+    def get_pair(device, interface="auto", diff_method="best"):
+        if (device, interface, diff_method) not in pairs:
+            dev = dev_cache(device, 2)
+            pairs[(device, interface, diff_method)] = tuple(
+                qml.QNode(circuit, dev, interface=interface, diff_method=diff_method)
+                for _ in range(2)
+            )
+        return pairs[(device, interface, diff_method)]
+
+    return get_pair
+
+
+@pytest.fixture(scope="module", name="ising_vn_entropy")
+def ising_vn_entropy_fixture(ising_qnode):
+    """Return a function that creates the von Neumann entropy transform of the IsingXX QNode,
+    reusing any transform with the same device, wires, base, interface and diff method."""
+    transforms = {}
+
+    def get_entropy(device, wires, base, interface="auto", diff_method="best"):
+        key = (device, tuple(wires), base, interface, diff_method)
+        if key not in transforms:
+            circuit_state = ising_qnode(device, interface, diff_method=diff_method)
+            transforms[key] = qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base)
+        return transforms[key]
+
+    return get_entropy
+
+
+@pytest.fixture(scope="module", name="jit_vn_entropy")
+def jit_vn_entropy_fixture(ising_vn_entropy):
+    """Return a function that creates the jitted von Neumann entropy of the IsingXX QNode, or its
+    jitted gradient, reusing the compiled function for the same arguments across parameters."""
+    compiled = {}
+
+    def get_jit(interface, wires, base, diff_method="best", grad=False):
+        key = (interface, tuple(wires), base, diff_method, grad)
+        if key not in compiled:
+            entropy = ising_vn_entropy("default.qubit", wires, base, interface, diff_method)
+            compiled[key] = jax.jit(jax.grad(entropy) if grad else entropy)
+        return compiled[key]
+
+    return get_jit
+
 
 def expected_entropy_ising_xx(param):
     """
-    Return the analytical entropy for the IsingXX.
+    Return the analytical entropy for the IsingXX. If ``param`` is an array, the
+    entropy is computed for each of its entries.
     """
-    eigs = [np.cos(param / 2) ** 2, np.sin(param / 2) ** 2]
-    eigs = [eig for eig in eigs if eig > 0]
+    eig_1 = np.cos(param / 2) ** 2
+    eig_2 = np.sin(param / 2) ** 2
 
-    expected_entropy = eigs * np.log(eigs)
-
-    expected_entropy = -np.sum(expected_entropy)
+    # xlogy is zero for zero eigenvalues, which do not contribute to the entropy
+    expected_entropy = -(xlogy(eig_1, eig_1) + xlogy(eig_2, eig_2))
     return expected_entropy
 
 
@@ -46,43 +187,74 @@ def expected_entropy_grad_ising_xx(param):
     """
     Return the analytical gradient entropy for the IsingXX.
     """
-    eig_1 = (1 + np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-    eig_2 = (1 - np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-    eigs = [eig_1, eig_2]
-    eigs = np.maximum(eigs, 1e-08)
-
-    grad_expected_entropy = -(
-        (np.log(eigs[0]) + 1)
-        * (np.sin(param / 2) ** 3 * np.cos(param / 2) - np.sin(param / 2) * np.cos(param / 2) ** 3)
-        / np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)
-    ) - (
-        (np.log(eigs[1]) + 1)
-        * (
-            np.sin(param / 2)
-            * np.cos(param / 2)
-            * (np.cos(param / 2) ** 2 - np.sin(param / 2) ** 2)
-        )
-        / np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)
-    )
+    cos = np.cos(param / 2)
+    sin = np.sin(param / 2)
+    sqrt_term = np.sqrt(1 - 4 * cos**2 * sin**2)
+
+    eig_1 = np.maximum((1 + sqrt_term) / 2, 1e-08)
+    eig_2 = np.maximum((1 - sqrt_term) / 2, 1e-08)
+
+    # the derivatives of the two eigenvalues only differ by their sign, so the two
+    # logarithms of the entropy gradient combine into a single log-ratio
+    grad_eig = sin * cos * (sin**2 - cos**2) / sqrt_term
+
+    grad_expected_entropy = grad_eig * np.log(eig_2 / eig_1)
     return grad_expected_entropy
 
 
+@functools.lru_cache(maxsize=None)
+def expected_relative_entropy(param0, param1):
+    """
+    Return the analytical relative entropy between the reduced states of two RY + CNOT
+    circuits with parameters ``param0`` and ``param1``.
+    """
+    cos0, sin0 = math.cos(param0 / 2), math.sin(param0 / 2)
+    cos1, sin1 = math.cos(param1 / 2), math.sin(param1 / 2)
+
+    first_term = 0 if cos0 == 0 else cos0**2 * (math.log(cos0**2) - math.log(cos1**2))
+    second_term = 0 if sin0 == 0 else sin0**2 * (math.log(sin0**2) - math.log(sin1**2))
+    return first_term + second_term
+
+
+@functools.lru_cache(maxsize=None)
+def expected_relative_entropy_grad(param0, param1):
+    """
+    Return the analytical gradient of the relative entropy between the reduced states of two
+    RY + CNOT circuits, with respect to ``param0`` and ``param1``.
+    """
+    cos0, sin0 = math.cos(param0 / 2), math.sin(param0 / 2)
+    tan0, tan1 = math.tan(param0 / 2), math.tan(param1 / 2)
+
+    grad0 = sin0 * cos0 * (math.log(tan0**2) - math.log(tan1**2))
+    grad1 = cos0**2 * tan1 - sin0**2 / tan1
+    return grad0, grad1
+
+
 class TestVonNeumannEntropy:
     """Tests Von Neumann entropy transform"""
 
     single_wires_list = [[0], [1]]
 
-    base = [2, np.exp(1), 10]
+    base = list(LOG_BASES)
 
     check_state = [True, False]
 
     parameters = np.linspace(0, 2 * np.pi, 10)
+
+    # the base only rescales the entropy, so each parameter is paired with a single base
+    # (cycling through them) instead of testing the full parameter x base product
+    expected_entropies = list(
+        zip(parameters, expected_entropy_ising_xx(parameters), itertools.cycle(base))
+    )
+    expected_entropy_grads = list(
+        zip(parameters, expected_entropy_grad_ising_xx(parameters), itertools.cycle(base))
+    )
     devices = ["default.qubit", "default.mixed", "lightning.qubit"]
 
-    def test_qinfo_vn_entropy_deprecated(self):
+    def test_qinfo_vn_entropy_deprecated(self, dev_cache):
         """Test that qinfo.vn_entropy is deprecated."""
 
-        dev = qml.device("default.qubit", wires=2)
+        dev = dev_cache("default.qubit", 2)
 
         @qml.qnode(dev)
         def circuit():
@@ -94,10 +266,10 @@ class TestVonNeumannEntropy:
         ):
             _ = qml.qinfo.vn_entropy(circuit, [0])()
 
-    def test_vn_entropy_cannot_specify_device(self):
+    def test_vn_entropy_cannot_specify_device(self, dev_cache):
         """Test that an error is raised if a device or device wires are given
         to the vn_entropy transform manually."""
-        dev = qml.device("default.qubit", wires=2)
+        dev = dev_cache("default.qubit", 2)
 
         @qml.qnode(dev)
         def circuit(params):
@@ -112,247 +284,196 @@ class TestVonNeumannEntropy:
             _ = qml.qinfo.vn_entropy(circuit, wires=[0], device_wires=dev.wires)
 
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
-    @pytest.mark.parametrize("device", devices)
+    @pytest.mark.parametrize("device", ["default.qubit", "default.mixed"])
     @pytest.mark.parametrize("base", base)
-    def test_IsingXX_qnode_entropy(self, param, wires, device, base):
-        """Test entropy for a QNode numpy."""
+    def test_IsingXX_qnode_entropy(self, wires, device, base, ising_vn_entropy):
+        """Test entropy for a QNode numpy, broadcasting over all parameters at once."""
 
-        dev = qml.device(device, wires=2)
+        vn_entropy = ising_vn_entropy(device, wires, base)
 
-        @qml.qnode(dev)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        entropy = vn_entropy(self.parameters)
+        expected_entropy = expected_entropy_ising_xx(self.parameters) / LOG_BASES[base]
+        assert_close(entropy, expected_entropy)
+
+    @pytest.mark.parametrize("wires", single_wires_list)
+    @pytest.mark.parametrize("param, natural_entropy, base", expected_entropies)
+    def test_IsingXX_qnode_entropy_lightning(
+        self, param, natural_entropy, wires, base, ising_vn_entropy
+    ):
+        """Test entropy for a QNode numpy on lightning.qubit, one parameter at a time."""
 
-        entropy = qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base)(param)
-        expected_entropy = expected_entropy_ising_xx(param) / np.log(base)
-        assert qml.math.allclose(entropy, expected_entropy)
+        vn_entropy = ising_vn_entropy("lightning.qubit", wires, base)
+
+        entropy = vn_entropy(param)
+        expected_entropy = natural_entropy / LOG_BASES[base]
+        assert_close(entropy, expected_entropy)
 
     interfaces = ["auto", "autograd"]
 
     @pytest.mark.autograd
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
-    @pytest.mark.parametrize("base", base)
+    @pytest.mark.parametrize("param, natural_entropy_grad, base", expected_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_entropy_grad(self, param, wires, base, interface):
+    def test_IsingXX_qnode_entropy_grad(
+        self, param, natural_entropy_grad, wires, base, interface, ising_vn_entropy
+    ):
         """Test entropy for a QNode gradient with autograd."""
 
-        dev = qml.device("default.qubit", wires=2)
+        vn_entropy = ising_vn_entropy("default.qubit", wires, base, interface)
 
-        @qml.qnode(dev, interface=interface)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
-
-        grad_entropy = qml.grad(qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base))(param)
-        grad_expected_entropy = expected_entropy_grad_ising_xx(param) / np.log(base)
-        assert qml.math.allclose(grad_entropy, grad_expected_entropy)
+        grad_entropy = qml.grad(vn_entropy)(param)
+        grad_expected_entropy = natural_entropy_grad / LOG_BASES[base]
+        assert_close(grad_entropy, grad_expected_entropy)
 
     interfaces = ["torch"]
 
     @pytest.mark.torch
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param, natural_entropy, base", expected_entropies)
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("base", base)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_torch_entropy(self, param, wires, device, base, interface):
+    def test_IsingXX_qnode_torch_entropy(
+        self, param, natural_entropy, wires, device, base, interface, ising_vn_entropy
+    ):
         """Test entropy for a QNode with torch interface."""
-        import torch
-
-        dev = qml.device(device, wires=2)
 
-        @qml.qnode(dev, interface=interface)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        vn_entropy = ising_vn_entropy(device, wires, base, interface)
 
-        entropy = qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base)(torch.tensor(param))
-        expected_entropy = expected_entropy_ising_xx(param) / np.log(base)
-        assert qml.math.allclose(entropy, expected_entropy)
+        entropy = vn_entropy(framework_param(param, "torch"))
+        expected_entropy = natural_entropy / LOG_BASES[base]
+        assert_close(entropy, expected_entropy)
 
     @pytest.mark.torch
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
-    @pytest.mark.parametrize("base", base)
+    @pytest.mark.parametrize("param, natural_entropy_grad, base", expected_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_entropy_grad_torch(self, param, wires, base, interface):
+    def test_IsingXX_qnode_entropy_grad_torch(
+        self, param, natural_entropy_grad, wires, base, interface, ising_vn_entropy
+    ):
         """Test entropy for a QNode gradient with torch."""
-        import torch
 
-        dev = qml.device("default.qubit", wires=2)
+        vn_entropy = ising_vn_entropy("default.qubit", wires, base, interface, "backprop")
 
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
-
-        eig_1 = (1 + np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-        eig_2 = (1 - np.sqrt(1 - 4 * np.cos(param / 2) ** 2 * np.sin(param / 2) ** 2)) / 2
-        eigs = [eig_1, eig_2]
-        eigs = np.maximum(eigs, 1e-08)
-
-        grad_expected_entropy = expected_entropy_grad_ising_xx(param) / np.log(base)
+        grad_expected_entropy = natural_entropy_grad / LOG_BASES[base]
 
         param = torch.tensor(param, dtype=torch.float64, requires_grad=True)
 
-        entropy = qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base)(param)
+        entropy = vn_entropy(param)
         entropy.backward()
         grad_entropy = param.grad
 
-        assert qml.math.allclose(grad_entropy, grad_expected_entropy)
+        assert_close(grad_entropy, grad_expected_entropy)
 
     interfaces = ["tf"]
 
     @pytest.mark.tf
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param, natural_entropy, base", expected_entropies)
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("base", base)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_tf_entropy(self, param, wires, device, base, interface):
+    def test_IsingXX_qnode_tf_entropy(
+        self, param, natural_entropy, wires, device, base, interface, ising_vn_entropy
+    ):
         """Test entropy for a QNode with tf interface."""
-        import tensorflow as tf
 
-        dev = qml.device(device, wires=2)
-
-        @qml.qnode(dev, interface=interface)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        vn_entropy = ising_vn_entropy(device, wires, base, interface)
 
-        entropy = qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base)(tf.Variable(param))
-        expected_entropy = expected_entropy_ising_xx(param) / np.log(base)
+        entropy = vn_entropy(framework_param(param, "tf"))
+        expected_entropy = natural_entropy / LOG_BASES[base]
 
-        assert qml.math.allclose(entropy, expected_entropy)
+        assert_close(entropy, expected_entropy)
 
     @pytest.mark.tf
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
-    @pytest.mark.parametrize("base", base)
+    @pytest.mark.parametrize("param, natural_entropy_grad, base", expected_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_entropy_grad_tf(self, param, wires, base, interface):
+    def test_IsingXX_qnode_entropy_grad_tf(
+        self, param, natural_entropy_grad, wires, base, interface, ising_vn_entropy
+    ):
         """Test entropy for a QNode gradient with tf."""
-        import tensorflow as tf
-
-        dev = qml.device("default.qubit", wires=2)
 
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        vn_entropy = ising_vn_entropy("default.qubit", wires, base, interface, "backprop")
 
         param = tf.Variable(param)
         with tf.GradientTape() as tape:
-            entropy = qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base)(param)
+            entropy = vn_entropy(param)
 
         grad_entropy = tape.gradient(entropy, param)
-        grad_expected_entropy = expected_entropy_grad_ising_xx(param) / np.log(base)
+        grad_expected_entropy = natural_entropy_grad / LOG_BASES[base]
 
-        assert qml.math.allclose(grad_entropy, grad_expected_entropy)
+        assert_close(grad_entropy, grad_expected_entropy)
 
     interfaces = ["jax"]
 
     @pytest.mark.jax
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
+    @pytest.mark.parametrize("param, natural_entropy, base", expected_entropies)
     @pytest.mark.parametrize("device", devices)
-    @pytest.mark.parametrize("base", base)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_jax_entropy(self, param, wires, device, base, interface):
+    def test_IsingXX_qnode_jax_entropy(
+        self, param, natural_entropy, wires, device, base, interface, ising_vn_entropy
+    ):
         """Test entropy for a QNode with jax interface."""
-        import jax.numpy as jnp
 
-        dev = qml.device(device, wires=2)
+        vn_entropy = ising_vn_entropy(device, wires, base, interface)
 
-        @qml.qnode(dev, interface=interface)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
-
-        entropy = qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base)(jnp.array(param))
-        expected_entropy = expected_entropy_ising_xx(param) / np.log(base)
+        entropy = vn_entropy(framework_param(param, "jax"))
+        expected_entropy = natural_entropy / LOG_BASES[base]
 
-        assert qml.math.allclose(entropy, expected_entropy)
+        assert_close(entropy, expected_entropy)
 
     @pytest.mark.jax
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
-    @pytest.mark.parametrize("base", base)
+    @pytest.mark.parametrize("param, natural_entropy_grad, base", expected_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_entropy_grad_jax(self, param, wires, base, interface):
+    def test_IsingXX_qnode_entropy_grad_jax(
+        self, param, natural_entropy_grad, wires, base, interface, ising_vn_entropy
+    ):
         """Test entropy for a QNode gradient with Jax."""
-        import jax
-
-        dev = qml.device("default.qubit", wires=2)
 
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        vn_entropy = ising_vn_entropy("default.qubit", wires, base, interface, "backprop")
 
-        grad_entropy = jax.grad(qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base))(
-            jax.numpy.array(param)
-        )
-        grad_expected_entropy = expected_entropy_grad_ising_xx(param) / np.log(base)
+        grad_entropy = jax.grad(vn_entropy)(framework_param(param, "jax"))
+        grad_expected_entropy = natural_entropy_grad / LOG_BASES[base]
 
-        assert qml.math.allclose(grad_entropy, grad_expected_entropy, rtol=1e-04, atol=1e-05)
+        assert_close(grad_entropy, grad_expected_entropy, rtol=1e-04, atol=1e-05)
 
     interfaces = ["jax-jit"]
 
     @pytest.mark.jax
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
-    @pytest.mark.parametrize("base", base)
+    @pytest.mark.parametrize("param, natural_entropy, base", expected_entropies)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_jax_jit_entropy(self, param, wires, base, interface):
+    def test_IsingXX_qnode_jax_jit_entropy(
+        self, param, natural_entropy, wires, base, interface, jit_vn_entropy
+    ):
         """Test entropy for a QNode with jax-jit interface."""
-        import jax
-        import jax.numpy as jnp
-
-        dev = qml.device("default.qubit", wires=2)
-
-        @qml.qnode(dev, interface=interface)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
 
-        entropy = jax.jit(qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base))(
-            jnp.array(param)
-        )
-        expected_entropy = expected_entropy_ising_xx(param) / np.log(base)
+        entropy = jit_vn_entropy(interface, wires, base)(framework_param(param, "jax"))
+        expected_entropy = natural_entropy / LOG_BASES[base]
 
-        assert qml.math.allclose(entropy, expected_entropy)
+        assert_close(entropy, expected_entropy)
 
     @pytest.mark.jax
     @pytest.mark.parametrize("wires", single_wires_list)
-    @pytest.mark.parametrize("param", parameters)
-    @pytest.mark.parametrize("base", base)
+    @pytest.mark.parametrize("param, natural_entropy_grad, base", expected_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_IsingXX_qnode_entropy_grad_jax_jit(self, param, wires, base, interface):
+    def test_IsingXX_qnode_entropy_grad_jax_jit(
+        self, param, natural_entropy_grad, wires, base, interface, jit_vn_entropy
+    ):
         """Test entropy for a QNode gradient with Jax-jit."""
-        import jax
-
-        dev = qml.device("default.qubit", wires=2)
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
 
-        grad_entropy = jax.jit(
-            jax.grad(qml.qinfo.vn_entropy(circuit_state, wires=wires, base=base))
-        )(jax.numpy.array(param))
-        grad_expected_entropy = expected_entropy_grad_ising_xx(param) / np.log(base)
+        grad_entropy = jit_vn_entropy(interface, wires, base, diff_method="backprop", grad=True)(
+            framework_param(param, "jax")
+        )
+        grad_expected_entropy = natural_entropy_grad / LOG_BASES[base]
 
-        assert qml.math.allclose(grad_entropy, grad_expected_entropy, rtol=1e-04, atol=1e-05)
+        assert_close(grad_entropy, grad_expected_entropy, rtol=1e-04, atol=1e-05)
 
-    def test_qnode_entropy_wires_full_range_not_state(self):
+    def test_qnode_entropy_wires_full_range_not_state(self, dev_cache):
         """Test entropy needs a QNode returning state."""
         param = 0.1
-        dev = qml.device("default.qubit", wires=2)
+        dev = dev_cache("default.qubit", 2)
 
         @qml.qnode(dev)
         def circuit_state(x):
@@ -365,40 +486,30 @@ class TestVonNeumannEntropy:
         ):
             qml.qinfo.vn_entropy(circuit_state, wires=[0, 1])(param)
 
-    def test_qnode_entropy_wires_full_range_state_vector(self):
+    def test_qnode_entropy_wires_full_range_state_vector(self, ising_qnode):
         """Test entropy for a QNode that returns a state vector with all wires, entropy is 0."""
         param = 0.1
-        dev = qml.device("default.qubit", wires=2)
-
-        @qml.qnode(dev)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        circuit_state = ising_qnode("default.qubit")
 
         entropy = qml.qinfo.vn_entropy(circuit_state, wires=[0, 1])(param)
         expected_entropy = 0.0
-        assert qml.math.allclose(entropy, expected_entropy)
+        assert_close(entropy, expected_entropy)
 
-    def test_qnode_entropy_wires_full_range_density_mat(self):
+    def test_qnode_entropy_wires_full_range_density_mat(self, ising_qnode):
         """Test entropy for a QNode that returns a density mat with all wires, entropy is 0."""
         param = 0.1
-        dev = qml.device("default.mixed", wires=2)
-
-        @qml.qnode(dev)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        circuit_state = ising_qnode("default.mixed")
 
         entropy = qml.qinfo.vn_entropy(circuit_state, wires=[0, 1])(param)
         expected_entropy = 0.0
-        assert qml.math.allclose(entropy, expected_entropy)
+        assert_close(entropy, expected_entropy)
 
     @pytest.mark.parametrize("device", devices)
-    def test_entropy_wire_labels(self, device, tol):
+    def test_entropy_wire_labels(self, device, tol, dev_cache):
         """Test that vn_entropy is correct with custom wire labels"""
         param = np.array(1.234)
-        wires = ["a", 8]
-        dev = qml.device(device, wires=wires)
+        wires = ("a", 8)
+        dev = dev_cache(device, wires)
 
         @qml.qnode(dev)
         def circuit(x):
@@ -409,12 +520,12 @@ class TestVonNeumannEntropy:
         entropy0 = qml.qinfo.vn_entropy(circuit, wires=[wires[0]])(param)
 
         eigs0 = [np.sin(param / 2) ** 2, np.cos(param / 2) ** 2]
-        exp0 = -np.sum(eigs0 * np.log(eigs0))
+        exp0 = -np.sum(xlogy(eigs0, eigs0))
 
         entropy1 = qml.qinfo.vn_entropy(circuit, wires=[wires[1]])(param)
 
         eigs1 = [np.cos(param / 2) ** 2, np.sin(param / 2) ** 2]
-        exp1 = -np.sum(eigs1 * np.log(eigs1))
+        exp1 = -np.sum(xlogy(eigs1, eigs1))
 
         assert np.allclose(exp0, entropy0, atol=tol)
         assert np.allclose(exp1, entropy1, atol=tol)
@@ -426,14 +537,18 @@ class TestRelativeEntropy:
     diff_methods = ["backprop", "finite-diff"]
 
     params = [[0.0, 0.0], [np.pi, 0.0], [0.0, np.pi], [0.123, 0.456], [0.789, 1.618]]
+    expected_rel_entropies = [(param, expected_relative_entropy(*param)) for param in params]
 
     # to avoid nan values in the gradient for relative entropy
     grad_params = [[0.123, 0.456], [0.789, 1.618]]
+    expected_rel_entropy_grads = [
+        (param, expected_relative_entropy_grad(*param)) for param in grad_params
+    ]
 
-    def test_qinfo_relative_entropy_deprecated(self):
+    def test_qinfo_relative_entropy_deprecated(self, dev_cache):
         """Test that qinfo.relative_entropy is deprecated."""
 
-        dev = qml.device("default.qubit", wires=2)
+        dev = dev_cache("default.qubit", 2)
 
         @qml.qnode(dev)
         def circuit(param):
@@ -452,170 +567,70 @@ class TestRelativeEntropy:
     @pytest.mark.all_interfaces
     @pytest.mark.parametrize("device", ["default.qubit", "default.mixed", "lightning.qubit"])
     @pytest.mark.parametrize("interface", ["autograd", "jax", "tensorflow", "torch"])
-    @pytest.mark.parametrize("param", params)
-    def test_qnode_relative_entropy(self, device, interface, param):
+    @pytest.mark.parametrize("param, expected", expected_rel_entropies)
+    def test_qnode_relative_entropy(self, device, interface, param, expected, ry_cnot_qnodes):
         """Test that the relative entropy transform works for QNodes by comparing
         against analytic values"""
-        dev = qml.device(device, wires=2)
-
         param = qml.math.asarray(np.array(param), like=interface)
 
-        @qml.qnode(dev, interface=interface)
-        def circuit1(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        @qml.qnode(dev, interface=interface)
-        def circuit2(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
+        circuit1, circuit2 = ry_cnot_qnodes(device, interface)
 
         rel_ent_circuit = qml.qinfo.relative_entropy(circuit1, circuit2, [0], [1])
         actual = rel_ent_circuit((param[0],), (param[1],))
 
-        # compare transform results with analytic results
-        first_term = (
-            0
-            if np.cos(param[0] / 2) == 0
-            else np.cos(param[0] / 2) ** 2
-            * (np.log(np.cos(param[0] / 2) ** 2) - np.log(np.cos(param[1] / 2) ** 2))
-        )
-        second_term = (
-            0
-            if np.sin(param[0] / 2) == 0
-            else np.sin(param[0] / 2) ** 2
-            * (np.log(np.sin(param[0] / 2) ** 2) - np.log(np.sin(param[1] / 2) ** 2))
-        )
-        expected = first_term + second_term
-
         assert np.allclose(actual, expected)
 
     interfaces = ["jax-jit"]
 
     @pytest.mark.jax
-    @pytest.mark.parametrize("param", params)
+    @pytest.mark.parametrize("param, expected", expected_rel_entropies)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_qnode_relative_entropy_jax_jit(self, param, interface):
+    def test_qnode_relative_entropy_jax_jit(self, param, expected, interface, ry_cnot_qnodes):
         """Test that the relative entropy transform works for QNodes by comparing
         against analytic values, for the JAX-jit interface"""
-        import jax
-        import jax.numpy as jnp
-
-        dev = qml.device("default.qubit", wires=2)
 
         param = jnp.array(param)
 
-        @qml.qnode(dev, interface=interface)
-        def circuit1(params):
-            qml.RY(params, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        @qml.qnode(dev, interface=interface)
-        def circuit2(params):
-            qml.RY(params, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
+        circuit1, circuit2 = ry_cnot_qnodes("default.qubit", interface)
 
         rel_ent_circuit = qml.qinfo.relative_entropy(circuit1, circuit2, [0], [1])
         actual = jax.jit(rel_ent_circuit)((param[0],), (param[1],))
 
-        # compare transform results with analytic results
-        first_term = (
-            0
-            if jnp.cos(param[0] / 2) == 0
-            else jnp.cos(param[0] / 2) ** 2
-            * (jnp.log(jnp.cos(param[0] / 2) ** 2) - jnp.log(jnp.cos(param[1] / 2) ** 2))
-        )
-        second_term = (
-            0
-            if jnp.sin(param[0] / 2) == 0
-            else jnp.sin(param[0] / 2) ** 2
-            * (jnp.log(jnp.sin(param[0] / 2) ** 2) - jnp.log(jnp.sin(param[1] / 2) ** 2))
-        )
-        expected = first_term + second_term
-
         assert np.allclose(actual, expected)
 
     @pytest.mark.jax
-    @pytest.mark.parametrize("param", grad_params)
+    @pytest.mark.parametrize("param, expected", expected_rel_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_qnode_grad_jax(self, param, interface):
+    def test_qnode_grad_jax(self, param, expected, interface, ry_cnot_qnodes):
         """Test that the gradient of relative entropy works for QNodes
         with the JAX interface"""
-        import jax
-        import jax.numpy as jnp
-
-        dev = qml.device("default.qubit", wires=2)
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit1(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
 
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit2(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
+        circuit1, circuit2 = ry_cnot_qnodes("default.qubit", interface, "backprop")
 
         rel_ent_circuit = qml.qinfo.relative_entropy(circuit1, circuit2, [0], [1])
 
         def wrapper(param0, param1):
             return rel_ent_circuit((param0,), (param1,))
 
-        expected = [
-            np.sin(param[0] / 2)
-            * np.cos(param[0] / 2)
-            * (np.log(np.tan(param[0] / 2) ** 2) - np.log(np.tan(param[1] / 2) ** 2)),
-            np.cos(param[0] / 2) ** 2 * np.tan(param[1] / 2)
-            - np.sin(param[0] / 2) ** 2 / np.tan(param[1] / 2),
-        ]
-
         param0, param1 = jnp.array(param[0]), jnp.array(param[1])
         actual = jax.grad(wrapper, argnums=[0, 1])(param0, param1)
 
         assert np.allclose(actual, expected, atol=1e-8)
 
     @pytest.mark.jax
-    @pytest.mark.parametrize("param", grad_params)
+    @pytest.mark.parametrize("param, expected", expected_rel_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_qnode_grad_jax_jit(self, param, interface):
+    def test_qnode_grad_jax_jit(self, param, expected, interface, ry_cnot_qnodes):
         """Test that the gradient of relative entropy works for QNodes
         with the JAX interface"""
-        import jax
-        import jax.numpy as jnp
-
-        dev = qml.device("default.qubit", wires=2)
 
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit1(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit2(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
+        circuit1, circuit2 = ry_cnot_qnodes("default.qubit", interface, "backprop")
 
         rel_ent_circuit = qml.qinfo.relative_entropy(circuit1, circuit2, [0], [1])
 
         def wrapper(param0, param1):
             return rel_ent_circuit((param0,), (param1,))
 
-        expected = [
-            np.sin(param[0] / 2)
-            * np.cos(param[0] / 2)
-            * (np.log(np.tan(param[0] / 2) ** 2) - np.log(np.tan(param[1] / 2) ** 2)),
-            np.cos(param[0] / 2) ** 2 * np.tan(param[1] / 2)
-            - np.sin(param[0] / 2) ** 2 / np.tan(param[1] / 2),
-        ]
-
         param0, param1 = jnp.array(param[0]), jnp.array(param[1])
         actual = jax.jit(jax.grad(wrapper, argnums=[0, 1]))(param0, param1)
 
@@ -624,39 +639,20 @@ class TestRelativeEntropy:
     interfaces = ["auto", "autograd"]
 
     @pytest.mark.autograd
-    @pytest.mark.parametrize("param", grad_params)
+    @pytest.mark.parametrize("param, expected", expected_rel_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_qnode_grad(self, param, interface):
+    def test_qnode_grad(self, param, expected, interface, ry_cnot_qnodes):
         """Test that the gradient of relative entropy works for QNodes
         with the autograd interface"""
-        dev = qml.device("default.qubit", wires=2)
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit1(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit2(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
+        circuit1, circuit2 = ry_cnot_qnodes("default.qubit", interface, "backprop")
 
         rel_ent_circuit = qml.qinfo.relative_entropy(circuit1, circuit2, [0], [1])
 
         def wrapper(param0, param1):
             return rel_ent_circuit((param0,), (param1,))
 
-        expected = [
-            np.sin(param[0] / 2)
-            * np.cos(param[0] / 2)
-            * (np.log(np.tan(param[0] / 2) ** 2) - np.log(np.tan(param[1] / 2) ** 2)),
-            np.cos(param[0] / 2) ** 2 * np.tan(param[1] / 2)
-            - np.sin(param[0] / 2) ** 2 / np.tan(param[1] / 2),
-        ]
-
-        param0, param1 = np.array(param[0]), np.array(param[1])
+        param_arr = np.array(param, dtype=np.float64)
+        param0, param1 = param_arr[0], param_arr[1]
         actual = qml.grad(wrapper)(param0, param1)
 
         assert np.allclose(actual, expected, atol=1e-8)
@@ -664,34 +660,13 @@ class TestRelativeEntropy:
     interfaces = ["tf"]
 
     @pytest.mark.tf
-    @pytest.mark.parametrize("param", grad_params)
+    @pytest.mark.parametrize("param, expected", expected_rel_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_qnode_grad_tf(self, param, interface):
+    def test_qnode_grad_tf(self, param, expected, interface, ry_cnot_qnodes):
         """Test that the gradient of relative entropy works for QNodes
         with the TensorFlow interface"""
-        import tensorflow as tf
-
-        dev = qml.device("default.qubit", wires=2)
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit1(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit2(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
 
-        expected = [
-            np.sin(param[0] / 2)
-            * np.cos(param[0] / 2)
-            * (np.log(np.tan(param[0] / 2) ** 2) - np.log(np.tan(param[1] / 2) ** 2)),
-            np.cos(param[0] / 2) ** 2 * np.tan(param[1] / 2)
-            - np.sin(param[0] / 2) ** 2 / np.tan(param[1] / 2),
-        ]
+        circuit1, circuit2 = ry_cnot_qnodes("default.qubit", interface, "backprop")
 
         param0, param1 = tf.Variable(param[0]), tf.Variable(param[1])
 
@@ -705,34 +680,13 @@ class TestRelativeEntropy:
     interfaces = ["torch"]
 
     @pytest.mark.torch
-    @pytest.mark.parametrize("param", grad_params)
+    @pytest.mark.parametrize("param, expected", expected_rel_entropy_grads)
     @pytest.mark.parametrize("interface", interfaces)
-    def test_qnode_grad_torch(self, param, interface):
+    def test_qnode_grad_torch(self, param, expected, interface, ry_cnot_qnodes):
         """Test that the gradient of relative entropy works for QNodes
         with the Torch interface"""
-        import torch
 
-        dev = qml.device("default.qubit", wires=2)
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit1(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        @qml.qnode(dev, interface=interface, diff_method="backprop")
-        def circuit2(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        expected = [
-            np.sin(param[0] / 2)
-            * np.cos(param[0] / 2)
-            * (np.log(np.tan(param[0] / 2) ** 2) - np.log(np.tan(param[1] / 2) ** 2)),
-            np.cos(param[0] / 2) ** 2 * np.tan(param[1] / 2)
-            - np.sin(param[0] / 2) ** 2 / np.tan(param[1] / 2),
-        ]
+        circuit1, circuit2 = ry_cnot_qnodes("default.qubit", interface, "backprop")
 
         param0 = torch.tensor(param[0], requires_grad=True)
         param1 = torch.tensor(param[1], requires_grad=True)
@@ -746,31 +700,19 @@ class TestRelativeEntropy:
     @pytest.mark.all_interfaces
     @pytest.mark.parametrize("device", ["default.qubit", "default.mixed", "lightning.qubit"])
     @pytest.mark.parametrize("interface", ["autograd", "jax", "tensorflow", "torch"])
-    def test_num_wires_mismatch(self, device, interface):
+    def test_num_wires_mismatch(self, device, interface, ry_cnot_qnodes):
         """Test that an error is raised when the number of wires in the
         two QNodes are different"""
-        dev = qml.device(device, wires=2)
-
-        @qml.qnode(dev, interface=interface)
-        def circuit1(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
-
-        @qml.qnode(dev, interface=interface)
-        def circuit2(param):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
+        circuit1, circuit2 = ry_cnot_qnodes(device, interface)
 
         msg = "The two states must have the same number of wires"
         with pytest.raises(qml.QuantumFunctionError, match=msg):
             qml.qinfo.relative_entropy(circuit1, circuit2, [0], [0, 1])
 
     @pytest.mark.parametrize("device", ["default.qubit", "default.mixed", "lightning.qubit"])
-    def test_full_wires(self, device):
+    def test_full_wires(self, device, dev_cache):
         """Test that the relative entropy transform for full wires works for QNodes"""
-        dev = qml.device(device, wires=1)
+        dev = dev_cache(device, 1)
 
         @qml.qnode(dev)
         def circuit1(param):
@@ -783,15 +725,15 @@ class TestRelativeEntropy:
             return qml.state()
 
         rel_ent_circuit = qml.qinfo.relative_entropy(circuit1, circuit2, [0], [0])
-        x, y = np.array(0.3), np.array(0.7)
+        x, y = 0.3, 0.7
 
         # test that the circuit executes
         rel_ent_circuit(x, y)
 
     @pytest.mark.parametrize("device", ["default.qubit", "default.mixed", "lightning.qubit"])
-    def test_qnode_no_args(self, device):
+    def test_qnode_no_args(self, device, dev_cache):
         """Test that the relative entropy transform works for QNodes without arguments"""
-        dev = qml.device(device, wires=2)
+        dev = dev_cache(device, 2)
 
         @qml.qnode(dev)
         def circuit1():
@@ -810,114 +752,74 @@ class TestRelativeEntropy:
         # test that the circuit executes
         rel_ent_circuit()
 
-    @pytest.mark.parametrize("device", ["default.qubit", "default.mixed", "lightning.qubit"])
-    def test_qnode_kwargs(self, device):
-        """Test that the relative entropy transform works for QNodes that take keyword arguments"""
-        dev = qml.device(device, wires=2)
-
-        @qml.qnode(dev)
-        def circuit1(param=0):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
-            return qml.state()
+    @pytest.mark.parametrize(
+        "device, wires",
+        [
+            ("default.qubit", (0, 1)),
+            ("default.qubit", ("a", 8)),
+            ("default.mixed", (0, 1)),
+            ("default.mixed", ("a", 8)),
+            ("lightning.qubit", (0, 1)),
+        ],
+    )
+    def test_qnode_kwargs(self, device, wires, dev_cache):
+        """Test that the relative entropy transform works for QNodes that take keyword arguments,
+        with both default and custom wire labels"""
+        dev = dev_cache(device, wires)
 
         @qml.qnode(dev)
-        def circuit2(param=0):
-            qml.RY(param, wires=0)
-            qml.CNOT(wires=[0, 1])
+        def circuit(param=0):
+            qml.RY(param, wires=wires[0])
+            qml.CNOT(wires=wires)
             return qml.state()
 
-        rel_ent_circuit = qml.qinfo.relative_entropy(circuit1, circuit2, [0], [1])
+        rel_ent_circuit = qml.qinfo.relative_entropy(circuit, circuit, [wires[0]], [wires[1]])
 
-        x, y = np.array(0.4), np.array(0.8)
+        x, y = 0.4, 0.8
         actual = rel_ent_circuit(({"param": x},), ({"param": y},))
 
         # compare transform results with analytic results
-        expected = (
-            np.cos(x / 2) ** 2 * (np.log(np.cos(x / 2) ** 2) - np.log(np.cos(y / 2) ** 2))
-        ) + (np.sin(x / 2) ** 2 * (np.log(np.sin(x / 2) ** 2) - np.log(np.sin(y / 2) ** 2)))
+        expected = expected_relative_entropy(x, y)
 
         assert np.allclose(actual, expected)
 
-    @pytest.mark.parametrize("device", ["default.qubit", "default.mixed", "lightning.qubit"])
-    def test_entropy_wire_labels(self, device, tol):
-        """Test that relative_entropy is correct with custom wire labels"""
-        param = np.array([0.678, 1.234])
-        wires = ["a", 8]
-        dev = qml.device(device, wires=wires)
-
-        @qml.qnode(dev)
-        def circuit(param):
-            qml.RY(param, wires=wires[0])
-            qml.CNOT(wires=wires)
-            return qml.state()
-
-        rel_ent_circuit = qml.qinfo.relative_entropy(circuit, circuit, [wires[0]], [wires[1]])
-        actual = rel_ent_circuit((param[0],), (param[1],))
-
-        # compare transform results with analytic results
-        first_term = np.cos(param[0] / 2) ** 2 * (
-            np.log(np.cos(param[0] / 2) ** 2) - np.log(np.cos(param[1] / 2) ** 2)
-        )
-        second_term = np.sin(param[0] / 2) ** 2 * (
-            np.log(np.sin(param[0] / 2) ** 2) - np.log(np.sin(param[1] / 2) ** 2)
-        )
-        expected = first_term + second_term
 
-        assert np.allclose(actual, expected, atol=tol)
+_BCAST_X = np.array([0.4, 0.6, 0.8])
+_BCAST_Y = np.array([0.6, 0.8, 1.0])
+_BCAST_EXPECTED_VN = expected_entropy_ising_xx(_BCAST_X)
 
 
 @pytest.mark.parametrize("device", ["default.qubit", "default.mixed"])
 class TestBroadcasting:
     """Test that the entropy transforms support broadcasting"""
 
-    def test_vn_entropy_broadcast(self, device):
+    def test_vn_entropy_broadcast(self, device, ising_qnode):
         """Test that the vn_entropy transform supports broadcasting"""
-        dev = qml.device(device, wires=2)
+        circuit_state = ising_qnode(device)
 
-        @qml.qnode(dev)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        entropy = qml.qinfo.vn_entropy(circuit_state, wires=[0])(_BCAST_X)
 
-        x = np.array([0.4, 0.6, 0.8])
-        entropy = qml.qinfo.vn_entropy(circuit_state, wires=[0])(x)
+        assert np.allclose(entropy, _BCAST_EXPECTED_VN)
 
-        expected = [expected_entropy_ising_xx(_x) for _x in x]
-        assert qml.math.allclose(entropy, expected)
-
-    def test_mutual_info_broadcast(self, device):
+    def test_mutual_info_broadcast(self, device, ising_qnode):
         """Test that the mutual_info transform supports broadcasting"""
-        dev = qml.device(device, wires=2)
-
-        @qml.qnode(dev)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
+        circuit_state = ising_qnode(device)
 
-        x = np.array([0.4, 0.6, 0.8])
-        minfo = qml.qinfo.mutual_info(circuit_state, wires0=[0], wires1=[1])(x)
+        minfo = qml.qinfo.mutual_info(circuit_state, wires0=[0], wires1=[1])(_BCAST_X)
 
-        expected = [2 * expected_entropy_ising_xx(_x) for _x in x]
-        assert qml.math.allclose(minfo, expected)
+        assert np.allclose(minfo, 2 * _BCAST_EXPECTED_VN)
 
-    def test_relative_entropy_broadcast(self, device):
+    def test_relative_entropy_broadcast(self, device, ising_qnode):
         """Test that the relative_entropy transform supports broadcasting"""
-        dev = qml.device(device, wires=2)
-
-        @qml.qnode(dev)
-        def circuit_state(x):
-            qml.IsingXX(x, wires=[0, 1])
-            return qml.state()
-
-        x = np.array([0.4, 0.6, 0.8])
-        y = np.array([0.6, 0.8, 1.0])
+        circuit_state = ising_qnode(device)
 
+        x, y = _BCAST_X, _BCAST_Y
         entropy = qml.qinfo.relative_entropy(circuit_state, circuit_state, wires0=[0], wires1=[1])(
             x, y
         )
 
-        eigs0 = np.stack([np.cos(x / 2) ** 2, np.sin(x / 2) ** 2])
-        eigs1 = np.stack([np.cos(y / 2) ** 2, np.sin(y / 2) ** 2])
-        expected = np.sum(eigs0 * np.log(eigs0), axis=0) - np.sum(eigs0 * np.log(eigs1), axis=0)
-        assert qml.math.allclose(entropy, expected)
+        cx, cy = np.cos(x / 2) ** 2, np.cos(y / 2) ** 2
+        eigs0 = np.stack([cx, 1 - cx])
+        eigs1 = np.stack([cy, 1 - cy])
+        expected = np.sum(xlogy(eigs0, eigs0 / eigs1), axis=0)
+        assert np.allclose(entropy, expected)